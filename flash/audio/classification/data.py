@@ -110,3 +110,4 @@ class AudioClassificationData(ImageClassificationData):
     """Data module for audio classification."""
 
     preprocess_cls = AudioClassificationPreprocess
+    persistent_workers = True
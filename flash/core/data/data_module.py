@@ -86,6 +86,9 @@ class DataModule(pl.LightningDataModule):
     preprocess_cls = DefaultPreprocess
     postprocess_cls = Postprocess
 
+    # Whether to keep the train and val worker processes alive between epochs (only used when ``num_workers > 0``).
+    persistent_workers: bool = False
+
     def __init__(
         self,
         train_dataset: Optional[Dataset] = None,
@@ -292,6 +295,7 @@ class DataModule(pl.LightningDataModule):
         else:
             drop_last = len(train_ds) > self.batch_size
         pin_memory = True
+        persistent_workers = self.persistent_workers and self.num_workers > 0
 
         if self.sampler is None:
             sampler = None
@@ -309,6 +313,7 @@ class DataModule(pl.LightningDataModule):
                 drop_last=drop_last,
                 collate_fn=collate_fn,
                 sampler=sampler,
+                persistent_workers=persistent_workers,
             )
 
         return DataLoader(
@@ -320,12 +325,14 @@ class DataModule(pl.LightningDataModule):
             pin_memory=pin_memory,
             drop_last=drop_last,
             collate_fn=collate_fn,
+            persistent_workers=persistent_workers,
         )
 
     def _val_dataloader(self) -> DataLoader:
         val_ds: Dataset = self._val_ds() if isinstance(self._val_ds, Callable) else self._val_ds
         collate_fn = self._resolve_collate_fn(val_ds, RunningStage.VALIDATING)
         pin_memory = True
+        persistent_workers = self.persistent_workers and self.num_workers > 0
 
         if isinstance(getattr(self, "trainer", None), pl.Trainer):
             return self.trainer.lightning_module.process_val_dataset(
@@ -334,6 +341,7 @@ class DataModule(pl.LightningDataModule):
                 num_workers=self.num_workers,
                 pin_memory=pin_memory,
                 collate_fn=collate_fn,
+                persistent_workers=persistent_workers,
             )
 
         return DataLoader(
@@ -342,6 +350,7 @@ class DataModule(pl.LightningDataModule):
             num_workers=self.num_workers,
             pin_memory=pin_memory,
             collate_fn=collate_fn,
+            persistent_workers=persistent_workers,
         )
 
     def _test_dataloader(self) -> DataLoader:
@@ -14,6 +14,7 @@
 import os
 import typing
 import warnings
+import weakref
 from dataclasses import dataclass
 from functools import partial
 from inspect import signature
@@ -21,7 +22,6 @@ from pathlib import Path
 from typing import (
     Any,
     Callable,
-    cast,
     Dict,
     Generic,
     Iterable,
@@ -107,22 +107,19 @@ def make_dataset(
     if both_none or both_something:
         raise ValueError("Both extensions and is_valid_file cannot be None or not None at the same time")
     if extensions is not None:
-
-        def is_valid_file(x: str) -> bool:
-            return has_file_allowed_extension(x, cast(Tuple[str, ...], extensions))
-
-    is_valid_file = cast(Callable[[str], bool], is_valid_file)
+        # Filter on the bare file names (before joining any paths) against the extensions lowercased once up front
+        extensions = tuple(extension.lower() for extension in extensions)
     for target_class in sorted(class_to_idx.keys()):
         class_index = class_to_idx[target_class]
         target_dir = os.path.join(directory, target_class)
         if not os.path.isdir(target_dir):
             continue
         for root, _, fnames in sorted(os.walk(target_dir, followlinks=True)):
-            for fname in sorted(fnames):
-                path = os.path.join(root, fname)
-                if is_valid_file(path):
-                    item = path, class_index
-                    instances.append(item)
+            if extensions is not None:
+                paths = (os.path.join(root, fname) for fname in sorted(fnames) if fname.lower().endswith(extensions))
+            else:
+                paths = filter(is_valid_file, (os.path.join(root, fname) for fname in sorted(fnames)))
+            instances.extend((path, class_index) for path in paths)
     return instances
 
 
@@ -633,6 +630,10 @@ class FiftyOneDataSource(DataSource[SampleCollection]):
     """The ``FiftyOneDataSource`` expects the input to
     :meth:`~flash.core.data.data_source.DataSource.load_data` to be a ``fiftyone.core.collections.SampleCollection``."""
 
+    # Maps ``(id(data), label_field)`` to a weak reference to ``data`` and its ``(classes, class_to_idx)``. This is a
+    # class attribute so that it is never pickled along with the data source (e.g. when sent to worker processes).
+    _classes_cache: Dict[Tuple[int, str], Tuple[weakref.ref, Tuple[List[str], Dict[str, int]]]] = {}
+
     def __init__(self, label_field: str = "ground_truth"):
         super().__init__()
         self.label_field = label_field
@@ -642,6 +643,13 @@ class FiftyOneDataSource(DataSource[SampleCollection]):
     def label_cls(self):
         return fol.Label
 
+    @classmethod
+    def clear_classes_cache(cls) -> None:
+        """Clear the cached classes of every ``SampleCollection``. The classes of each collection are only computed
+        once, so this should be called if labels with new classes have been added to a collection (or its declared
+        classes have changed) since it was last loaded."""
+        cls._classes_cache.clear()
+
     @requires("fiftyone")
     def load_data(self, data: SampleCollection, dataset: Optional[Any] = None) -> Sequence[Mapping[str, Any]]:
         self._validate(data)
@@ -651,13 +659,11 @@ class FiftyOneDataSource(DataSource[SampleCollection]):
         filepaths = data.values("filepath")
         targets = data.values(label_path)
 
-        classes = self._get_classes(data)
+        classes, class_to_idx = self._get_class_to_idx(data)
 
         if dataset is not None:
             dataset.num_classes = len(classes)
 
-        class_to_idx = {cls_name: i for i, cls_name in enumerate(classes)}
-
         if targets and isinstance(targets[0], list):
 
             def to_idx(t):
@@ -686,6 +692,29 @@ class FiftyOneDataSource(DataSource[SampleCollection]):
         if not issubclass(label_type, self.label_cls):
             raise ValueError(f"Expected field '{self.label_field}' to have type {self.label_cls}; found {label_type}")
 
+    def _get_class_to_idx(self, data) -> Tuple[List[str], Dict[str, int]]:
+        """Returns the classes of the given ``SampleCollection`` and the mapping from class name to index.
+
+        The result is cached until the collection is garbage collected, so loading the same collection object again
+        (e.g. in a sweep) doesn't scan its labels again. Call
+        :meth:`~flash.core.data.data_source.FiftyOneDataSource.clear_classes_cache` if labels have been added since.
+        """
+        key = (id(data), self.label_field)
+        cached = self._classes_cache.get(key)
+        if cached is not None and cached[0]() is data:
+            return cached[1]
+
+        classes = self._get_classes(data)
+        result = classes, {cls_name: i for i, cls_name in enumerate(classes)}
+        cache = self._classes_cache
+        try:
+            # the callback evicts the entry as soon as ``data`` is garbage collected
+            cache[key] = (weakref.ref(data, lambda _: cache.pop(key, None)), result)
+        except TypeError:
+            # ``data`` doesn't support weak references, so we can't safely cache its classes
+            pass
+        return result
+
     def _get_classes(self, data):
         classes = data.classes.get(self.label_field, None)
 
@@ -725,6 +725,7 @@ class Task(LightningModule, metaclass=CheckDependenciesMeta):
         drop_last: bool = True,
         sampler: Optional[Sampler] = None,
         convert_to_dataloader: bool = True,
+        persistent_workers: bool = False,
     ) -> DataLoader:
         if convert_to_dataloader:
             return DataLoader(
@@ -736,6 +737,7 @@ class Task(LightningModule, metaclass=CheckDependenciesMeta):
                 drop_last=drop_last,
                 collate_fn=collate_fn,
                 sampler=sampler,
+                persistent_workers=persistent_workers,
             )
         return dataset
 
@@ -749,6 +751,7 @@ class Task(LightningModule, metaclass=CheckDependenciesMeta):
         shuffle: bool = False,
         drop_last: bool = True,
         sampler: Optional[Sampler] = None,
+        persistent_workers: bool = False,
     ) -> DataLoader:
         return self._process_dataset(
             dataset,
@@ -759,6 +762,7 @@ class Task(LightningModule, metaclass=CheckDependenciesMeta):
             shuffle=shuffle,
             drop_last=drop_last,
             sampler=sampler,
+            persistent_workers=persistent_workers,
         )
 
     def process_val_dataset(
@@ -771,6 +775,7 @@ class Task(LightningModule, metaclass=CheckDependenciesMeta):
         shuffle: bool = False,
         drop_last: bool = False,
         sampler: Optional[Sampler] = None,
+        persistent_workers: bool = False,
     ) -> DataLoader:
         return self._process_dataset(
             dataset,
@@ -781,6 +786,7 @@ class Task(LightningModule, metaclass=CheckDependenciesMeta):
             shuffle=shuffle,
             drop_last=drop_last,
             sampler=sampler,
+            persistent_workers=persistent_workers,
         )
 
     def process_test_dataset(
@@ -85,6 +85,11 @@ _GRAPHVIZ_AVAILABLE = _module_available("graphviz")
 _CYTOOLZ_AVAILABLE = _module_available("cytoolz")
 _UVICORN_AVAILABLE = _module_available("uvicorn")
 _PIL_AVAILABLE = _module_available("PIL")
+_JPEG4PY_AVAILABLE = _module_available("jpeg4py")
+_TURBOJPEG_AVAILABLE = _module_available("turbojpeg")
+_WEBDATASET_AVAILABLE = _module_available("webdataset")
+_NUMBA_AVAILABLE = _module_available("numba")
+_ORJSON_AVAILABLE = _module_available("orjson")
 _OPEN3D_AVAILABLE = _module_available("open3d")
 _SEGMENTATION_MODELS_AVAILABLE = _module_available("segmentation_models_pytorch")
 _SOUNDFILE_AVAILABLE = _module_available("soundfile")
@@ -97,7 +102,13 @@ _SENTENCEPIECE_AVAILABLE = _module_available("sentencepiece")
 _DATASETS_AVAILABLE = _module_available("datasets")
 
 if Version:
+    _TORCH_GREATER_EQUAL_1_10 = _compare_version("torch", operator.ge, "1.10.0")
     _TORCHVISION_GREATER_EQUAL_0_9 = _compare_version("torchvision", operator.ge, "0.9.0")
+    _TORCHVISION_GREATER_EQUAL_0_10 = _compare_version("torchvision", operator.ge, "0.10.0")
+else:
+    _TORCH_GREATER_EQUAL_1_10 = False
+    _TORCHVISION_GREATER_EQUAL_0_9 = False
+    _TORCHVISION_GREATER_EQUAL_0_10 = False
 
 _TEXT_AVAILABLE = all(
     [
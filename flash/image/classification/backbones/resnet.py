@@ -16,8 +16,8 @@
 # ResNet encoder adapted from: https://github.com/facebookresearch/swav/blob/master/src/resnet50.py
 # as the official torchvision implementation does not support wide resnet architecture
 # found in self-supervised learning model weights
-from functools import partial
-from typing import Any, Callable, List, Optional, Type, Union
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 import torch
 import torch.nn as nn
@@ -302,6 +302,23 @@ class ResNet(nn.Module):
         return x
 
 
+@lru_cache(maxsize=4)
+def _load_trunk_weights(url: str, map_location: torch.device, vissl: bool = False) -> Dict[str, Tensor]:
+    """Load the checkpoint at the given URL and extract the weights of the ``ResNet`` trunk (without the ``fc``
+    layer). Only the extracted weights are kept by the cache, the rest of the checkpoint (e.g. the VISSL heads) is
+    released. The returned dictionary must not be modified."""
+    checkpoint = load_state_dict_from_url(url, map_location=map_location)
+
+    if not vissl:
+        # for supervised pretrained weights
+        return {key: val for key, val in checkpoint.items() if key not in ("fc.weight", "fc.bias")}
+
+    if "classy_state_dict" not in checkpoint.keys():
+        raise KeyError("Unrecognized state dict. Logic for loading the current state dict missing.")
+    trunk = checkpoint["classy_state_dict"]["base_model"]["model"]["trunk"]
+    return {key.replace("_feature_blocks.", ""): val for key, val in trunk.items()}
+
+
 def _resnet(
     model_name: str,
     block: Type[Union[BasicBlock, Bottleneck]],
@@ -316,34 +333,18 @@ def _resnet(
 
     backbone = ResNet(block, layers, **kwargs)
     device = next(backbone.parameters()).get_device()
+    map_location = torch.device("cpu") if device == -1 else torch.device(device)
 
     model_weights = None
     if pretrained_flag:
         if "supervised" not in weights_paths:
             raise KeyError(f"Supervised pretrained weights not available for {model_name}")
 
-        model_weights = load_state_dict_from_url(
-            weights_paths["supervised"], map_location=torch.device("cpu") if device == -1 else torch.device(device)
-        )
-
-        # for supervised pretrained weights
-        model_weights.pop("fc.weight")
-        model_weights.pop("fc.bias")
+        model_weights = _load_trunk_weights(weights_paths["supervised"], map_location)
 
     if not pretrained_flag and isinstance(pretrained, str):
         if pretrained in weights_paths:
-            model_weights = load_state_dict_from_url(
-                weights_paths[pretrained], map_location=torch.device("cpu") if device == -1 else torch.device(device)
-            )
-
-            if "classy_state_dict" in model_weights.keys():
-                model_weights = model_weights["classy_state_dict"]["base_model"]["model"]["trunk"]
-                model_weights = {
-                    key.replace("_feature_blocks.", "") if "_feature_blocks." in key else key: val
-                    for (key, val) in model_weights.items()
-                }
-            else:
-                raise KeyError("Unrecognized state dict. Logic for loading the current state dict missing.")
+            model_weights = _load_trunk_weights(weights_paths[pretrained], map_location, vissl=True)
         else:
             raise KeyError(
                 f"Requested weights for {model_name} not available," f" choose from one of {weights_paths.keys()}"
@@ -11,9 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from functools import partial
-from typing import Tuple
+from functools import lru_cache, partial
+from typing import Dict, Tuple
 
+import torch
 import torch.nn as nn
 
 from flash.core.registry import FlashRegistry
@@ -27,27 +28,45 @@ RESNEXT_MODELS = ["resnext50_32x4d", "resnext101_32x8d"]
 DENSENET_MODELS = ["densenet121", "densenet169", "densenet161"]
 TORCHVISION_MODELS = MOBILENET_MODELS + VGG_MODELS + RESNEXT_MODELS + RESNET_MODELS + DENSENET_MODELS
 
+# The number of features output by each backbone (the input width of the torchvision classifier that is dropped)
+NUM_FEATURES = {
+    "mobilenet_v2": 1280,
+    "vgg11": 512,
+    "vgg13": 512,
+    "vgg16": 512,
+    "vgg19": 512,
+    "resnext50_32x4d": 2048,
+    "resnext101_32x8d": 2048,
+    "densenet121": 1024,
+    "densenet169": 1664,
+    "densenet161": 2208,
+}
+
 if _TORCHVISION_AVAILABLE:
     import torchvision
 
-    def _fn_mobilenet_vgg(model_name: str, pretrained: bool = True) -> Tuple[nn.Module, int]:
-        model: nn.Module = getattr(torchvision.models, model_name, None)(pretrained)
-        backbone = model.features
-        num_features = 512 if model_name in VGG_MODELS else model.classifier[-1].in_features
-        return backbone, num_features
+    @lru_cache(maxsize=4)
+    def _pretrained_state_dict(model_name: str) -> Dict[str, torch.Tensor]:
+        # read-only: the cached tensors are copied into each new model by ``load_state_dict``
+        return getattr(torchvision.models, model_name)(pretrained=True).state_dict()
 
-    def _fn_resnext(model_name: str, pretrained: bool = True):
-        model: nn.Module = getattr(torchvision.models, model_name, None)(pretrained)
-        backbone = nn.Sequential(*list(model.children())[:-2])
-        num_features = model.fc.in_features
+    def _load_model(model_name: str, pretrained: bool = True) -> nn.Module:
+        model: nn.Module = getattr(torchvision.models, model_name)(pretrained=False)
+        if pretrained:
+            model.load_state_dict(_pretrained_state_dict(model_name))
+        return model
+
+    def _fn_mobilenet_vgg(model_name: str, pretrained: bool = True) -> Tuple[nn.Module, int]:
+        model: nn.Module = _load_model(model_name, pretrained)
+        return model.features, NUM_FEATURES[model_name]
 
-        return backbone, num_features
+    def _fn_resnext(model_name: str, pretrained: bool = True) -> Tuple[nn.Module, int]:
+        model: nn.Module = _load_model(model_name, pretrained)
+        return nn.Sequential(*list(model.children())[:-2]), NUM_FEATURES[model_name]
 
     def _fn_densenet(model_name: str, pretrained: bool = True) -> Tuple[nn.Module, int]:
-        model: nn.Module = getattr(torchvision.models, model_name, None)(pretrained)
-        backbone = nn.Sequential(*model.features, nn.ReLU(inplace=True))
-        num_features = model.classifier.in_features
-        return backbone, num_features
+        model: nn.Module = _load_model(model_name, pretrained)
+        return nn.Sequential(*model.features, nn.ReLU(inplace=True)), NUM_FEATURES[model_name]
 
 
 def register_mobilenet_vgg_backbones(register: FlashRegistry):
@@ -11,6 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+import random
+import tarfile
+from io import BytesIO
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 import numpy as np
@@ -22,9 +26,23 @@ from torch.utils.data.sampler import Sampler
 from flash.core.data.base_viz import BaseVisualization  # for viz
 from flash.core.data.callback import BaseDataFetcher
 from flash.core.data.data_module import DataModule
-from flash.core.data.data_source import DefaultDataKeys, DefaultDataSources, LoaderDataFrameDataSource
+from flash.core.data.data_source import (
+    DataSource,
+    DefaultDataKeys,
+    DefaultDataSources,
+    LabelsState,
+    LoaderDataFrameDataSource,
+    make_dataset,
+    PathsDataSource,
+)
 from flash.core.data.process import Deserializer, Preprocess
-from flash.core.utilities.imports import _MATPLOTLIB_AVAILABLE, _PIL_AVAILABLE, requires, requires_extras
+from flash.core.utilities.imports import (
+    _MATPLOTLIB_AVAILABLE,
+    _PIL_AVAILABLE,
+    _WEBDATASET_AVAILABLE,
+    requires,
+    requires_extras,
+)
 from flash.image.classification.transforms import default_transforms, train_default_transforms
 from flash.image.data import (
     image_loader,
@@ -33,6 +51,7 @@ from flash.image.data import (
     ImageNumpyDataSource,
     ImagePathsDataSource,
     ImageTensorDataSource,
+    IMG_EXTENSIONS,
 )
 
 if _MATPLOTLIB_AVAILABLE:
@@ -48,6 +67,10 @@ else:
         Image = None
 
 
+if _WEBDATASET_AVAILABLE:
+    import webdataset as wds
+
+
 class ImageClassificationDataFrameDataSource(LoaderDataFrameDataSource):
     @requires_extras("image")
     def __init__(self):
@@ -60,6 +83,98 @@ class ImageClassificationDataFrameDataSource(LoaderDataFrameDataSource):
         return sample
 
 
+class ImageClassificationWebDatasetDataSource(DataSource[Tuple[Union[str, List[str]], Optional[List[str]]]]):
+    """The ``ImageClassificationWebDatasetDataSource`` streams samples from TAR shards in the `WebDataset
+    <https://github.com/webdataset/webdataset>`_ format (for example, created with
+    :func:`~flash.image.classification.data.pack_folders_to_tar`). Each sample in the shards should contain an image
+    and, when training, validating, or testing, its integer class index under the ``cls`` extension. The data should
+    be a tuple of the shard URL(s) and the list of class names (or ``None`` if the class names aren't known).
+
+    Args:
+        shuffle_buffer: The number of samples to shuffle over when training.
+    """
+
+    IMAGE_KEYS = tuple(extension[1:] for extension in IMG_EXTENSIONS)
+
+    def __init__(self, shuffle_buffer: int = 1000):
+        super().__init__()
+
+        self.shuffle_buffer = shuffle_buffer
+
+    @classmethod
+    def _to_sample(cls, sample: Dict[str, Any]) -> Dict[str, Any]:
+        key = next(key for key in cls.IMAGE_KEYS if key in sample)
+        result = {DefaultDataKeys.INPUT: sample[key], DefaultDataKeys.METADATA: {"key": sample["__key__"]}}
+        if "cls" in sample:
+            result[DefaultDataKeys.TARGET] = int(sample["cls"])
+        return result
+
+    @requires("webdataset")
+    def load_data(self, data: Tuple[Union[str, List[str]], Optional[List[str]]], dataset: Optional[Any] = None) -> Any:
+        shards, classes = data
+        if classes is not None and not self.predicting:
+            self.set_state(LabelsState(classes))
+
+            if dataset is not None:
+                dataset.num_classes = len(classes)
+
+        data = wds.WebDataset(shards)
+        if self.training:
+            data = data.shuffle(self.shuffle_buffer)
+        return data.map(self._to_sample)
+
+    def load_sample(self, sample: Dict[str, Any], dataset: Optional[Any] = None) -> Dict[str, Any]:
+        img = Image.open(BytesIO(sample[DefaultDataKeys.INPUT])).convert("RGB")
+        sample[DefaultDataKeys.INPUT] = img
+        w, h = img.size  # WxH
+        sample[DefaultDataKeys.METADATA]["size"] = (h, w)
+        return sample
+
+
+def pack_folders_to_tar(
+    folder: str, shard_pattern: str, samples_per_shard: int = 10000, shuffle: bool = True, seed: int = 42
+) -> Tuple[List[str], List[str]]:
+    """Convert a folder containing a subfolder of images for each class into TAR shards in the WebDataset format,
+    ready to be used with :meth:`~flash.image.classification.data.ImageClassificationData.from_webdataset`. Reading
+    a few large shards sequentially is typically much faster than reading many small image files in a random order.
+
+    Args:
+        folder: The folder containing a subfolder of images for each class.
+        shard_pattern: The pattern for the shard file paths, formatted with the shard index (e.g.
+            ``"shards/train-%06d.tar"``).
+        samples_per_shard: The maximum number of samples to write to each shard.
+        shuffle: If ``True``, the samples are shuffled before being written so that each shard contains a mix of
+            classes.
+        seed: The random seed to use when shuffling.
+
+    Returns:
+        The paths of the written shards and the list of class names (indexed by the ``cls`` targets in the shards).
+
+    Examples::
+
+        shards, classes = pack_folders_to_tar("data/hymenoptera_data/train/", "data/shards/train-%06d.tar")
+    """
+    classes, class_to_idx = PathsDataSource.find_classes(folder)
+    samples = make_dataset(folder, class_to_idx, extensions=IMG_EXTENSIONS)
+    if shuffle:
+        random.Random(seed).shuffle(samples)
+
+    shards = []
+    for shard_index, start in enumerate(range(0, len(samples), samples_per_shard)):
+        shard = shard_pattern % shard_index
+        # symlinked images are stored as regular files, since the folder walk follows the links
+        with tarfile.open(shard, "w", dereference=True) as tar:
+            for index, (filepath, target) in enumerate(samples[start : start + samples_per_shard], start):
+                key = f"{index:09d}"
+                tar.add(filepath, arcname=f"{key}{os.path.splitext(filepath)[1].lower()}")
+                target = str(target).encode("ascii")
+                info = tarfile.TarInfo(f"{key}.cls")
+                info.size = len(target)
+                tar.addfile(info, BytesIO(target))
+        shards.append(shard)
+    return shards, classes
+
+
 class ImageClassificationPreprocess(Preprocess):
     def __init__(
         self,
@@ -86,6 +201,7 @@ class ImageClassificationPreprocess(Preprocess):
                 DefaultDataSources.TENSORS: ImageTensorDataSource(),
                 "data_frame": ImageClassificationDataFrameDataSource(),
                 DefaultDataSources.CSV: ImageClassificationDataFrameDataSource(),
+                "webdataset": ImageClassificationWebDatasetDataSource(),
             },
             deserializer=deserializer or ImageDeserializer(),
             default_data_source=DefaultDataSources.FILES,
@@ -109,6 +225,7 @@ class ImageClassificationData(DataModule):
     """Data module for image classification tasks."""
 
     preprocess_cls = ImageClassificationPreprocess
+    persistent_workers = True
 
     @classmethod
     def from_data_frame(
@@ -324,6 +441,83 @@ class ImageClassificationData(DataModule):
             **preprocess_kwargs,
         )
 
+    @classmethod
+    def from_webdataset(
+        cls,
+        train_shards: Optional[Union[str, List[str]]] = None,
+        val_shards: Optional[Union[str, List[str]]] = None,
+        test_shards: Optional[Union[str, List[str]]] = None,
+        predict_shards: Optional[Union[str, List[str]]] = None,
+        classes: Optional[List[str]] = None,
+        train_transform: Optional[Dict[str, Callable]] = None,
+        val_transform: Optional[Dict[str, Callable]] = None,
+        test_transform: Optional[Dict[str, Callable]] = None,
+        predict_transform: Optional[Dict[str, Callable]] = None,
+        data_fetcher: Optional[BaseDataFetcher] = None,
+        preprocess: Optional[Preprocess] = None,
+        batch_size: int = 4,
+        num_workers: Optional[int] = None,
+        **preprocess_kwargs: Any,
+    ) -> "DataModule":
+        """Creates a :class:`~flash.image.classification.data.ImageClassificationData` object which streams samples
+        from TAR shards in the `WebDataset <https://github.com/webdataset/webdataset>`_ format. Shards can be created
+        from a folder dataset with :func:`~flash.image.classification.data.pack_folders_to_tar`.
+
+        Args:
+            train_shards: The shard URL(s) or brace pattern (e.g. ``"shards/train-{000000..000009}.tar"``) containing
+                the train data.
+            val_shards: The shard URL(s) or brace pattern containing the validation data.
+            test_shards: The shard URL(s) or brace pattern containing the test data.
+            predict_shards: The shard URL(s) or brace pattern containing the predict data.
+            classes: The list of class names, indexed by the ``cls`` targets in the shards (for example, as returned by
+                :func:`~flash.image.classification.data.pack_folders_to_tar`). Used to set ``num_classes`` and the
+                labels used when serializing predictions.
+            train_transform: The dictionary of transforms to use during training which maps
+                :class:`~flash.core.data.process.Preprocess` hook names to callable transforms.
+            val_transform: The dictionary of transforms to use during validation which maps
+                :class:`~flash.core.data.process.Preprocess` hook names to callable transforms.
+            test_transform: The dictionary of transforms to use during testing which maps
+                :class:`~flash.core.data.process.Preprocess` hook names to callable transforms.
+            predict_transform: The dictionary of transforms to use during predicting which maps
+                :class:`~flash.core.data.process.Preprocess` hook names to callable transforms.
+            data_fetcher: The :class:`~flash.core.data.callback.BaseDataFetcher` to pass to the
+                :class:`~flash.core.data.data_module.DataModule`.
+            preprocess: The :class:`~flash.core.data.data.Preprocess` to pass to the
+                :class:`~flash.core.data.data_module.DataModule`. If ``None``, ``cls.preprocess_cls``
+                will be constructed and used.
+            batch_size: The ``batch_size`` argument to pass to the :class:`~flash.core.data.data_module.DataModule`.
+            num_workers: The ``num_workers`` argument to pass to the :class:`~flash.core.data.data_module.DataModule`.
+            preprocess_kwargs: Additional keyword arguments to use when constructing the preprocess. Will only be used
+                if ``preprocess = None``.
+
+        Returns:
+            The constructed data module.
+
+        Examples::
+
+            data_module = ImageClassificationData.from_webdataset(
+                train_shards="data/shards/train-{000000..000009}.tar",
+                val_shards="data/shards/val-000000.tar",
+                classes=["ants", "bees"],
+            )
+        """
+        return cls.from_data_source(
+            "webdataset",
+            (train_shards, classes) if train_shards else None,
+            (val_shards, classes) if val_shards else None,
+            (test_shards, classes) if test_shards else None,
+            (predict_shards, classes) if predict_shards else None,
+            train_transform=train_transform,
+            val_transform=val_transform,
+            test_transform=test_transform,
+            predict_transform=predict_transform,
+            data_fetcher=data_fetcher,
+            preprocess=preprocess,
+            batch_size=batch_size,
+            num_workers=num_workers,
+            **preprocess_kwargs,
+        )
+
     def set_block_viz_window(self, value: bool) -> None:
         """Setter method to switch on/off matplotlib to pop up windows."""
         self.data_fetcher.block_viz_window = value
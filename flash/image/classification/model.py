@@ -11,10 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from contextlib import suppress
+from copy import deepcopy
+from inspect import signature
+from itertools import chain
 from types import FunctionType
-from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type, Union
 
 import torch
+from pytorch_lightning.utilities import rank_zero_warn
 from torch import nn
 from torch.optim.lr_scheduler import _LRScheduler
 from torchmetrics import Metric
@@ -23,7 +28,16 @@ from flash.core.classification import ClassificationTask, Labels
 from flash.core.data.data_source import DefaultDataKeys
 from flash.core.data.process import Serializer
 from flash.core.registry import FlashRegistry
+from flash.core.utilities.imports import _TORCH_GREATER_EQUAL_1_10
 from flash.image.classification.backbones import IMAGE_CLASSIFIER_BACKBONES
+from flash.image.classification.transforms import normalize_transform
+
+# Batches are keyed by the ``DefaultDataKeys`` members themselves, so we bind them once here rather than looking them up
+# on the enum class in every step. Keeping the members (rather than their string values) means dictionary lookups hit
+# the identity check and never fall through to ``LightningEnum.__eq__``.
+_INPUT = DefaultDataKeys.INPUT
+_TARGET = DefaultDataKeys.TARGET
+_PREDS = DefaultDataKeys.PREDS
 
 
 class ImageClassifier(ClassificationTask):
@@ -114,26 +128,145 @@ class ImageClassifier(ClassificationTask):
             nn.Linear(num_features, num_classes),
         )
 
+        # Convolutions run faster with NHWC kernels (cuDNN on recent GPUs and oneDNN on the CPU)
+        self.backbone.to(memory_format=torch.channels_last)
+
+        self._set_predict_backbone(None)
+        self.__dict__["_quantized_backbone"] = None
+
     def training_step(self, batch: Any, batch_idx: int) -> Any:
-        batch = (batch[DefaultDataKeys.INPUT], batch[DefaultDataKeys.TARGET])
-        return super().training_step(batch, batch_idx)
+        batch = (batch[_INPUT], batch[_TARGET])
+        with self._autocast():
+            return super().training_step(batch, batch_idx)
 
     def validation_step(self, batch: Any, batch_idx: int) -> Any:
-        batch = (batch[DefaultDataKeys.INPUT], batch[DefaultDataKeys.TARGET])
-        return super().validation_step(batch, batch_idx)
+        batch = (batch[_INPUT], batch[_TARGET])
+        with self._autocast():
+            return super().validation_step(batch, batch_idx)
 
     def test_step(self, batch: Any, batch_idx: int) -> Any:
-        batch = (batch[DefaultDataKeys.INPUT], batch[DefaultDataKeys.TARGET])
-        return super().test_step(batch, batch_idx)
+        batch = (batch[_INPUT], batch[_TARGET])
+        with self._autocast():
+            return super().test_step(batch, batch_idx)
+
+    def _autocast(self):
+        """Returns a ``bfloat16`` autocast context when running on a CUDA device which supports it (unless autocast
+        is already enabled, e.g. by the ``Trainer`` precision), otherwise a no-op context.
+
+        ``float16`` is not used here since, unlike ``bfloat16``, it needs loss scaling to train reliably.
+        """
+        if (
+            _TORCH_GREATER_EQUAL_1_10
+            and self.device.type == "cuda"
+            and not torch.is_autocast_enabled()
+            and torch.cuda.is_bf16_supported()
+        ):
+            return torch.autocast("cuda", dtype=torch.bfloat16)
+        return suppress()  # a no-op context (``contextlib.nullcontext`` needs Python 3.7)
 
     def predict_step(self, batch: Any, batch_idx: int, dataloader_idx: int = 0) -> Any:
-        batch[DefaultDataKeys.PREDS] = super().predict_step(
-            (batch[DefaultDataKeys.INPUT]), batch_idx, dataloader_idx=dataloader_idx
-        )
+        if self._predict_backbone is not None:
+            x = batch[_INPUT]
+            if x.dim() == 4:
+                x = x.contiguous(memory_format=torch.channels_last)
+            batch[_PREDS] = self._forward_head(self._predict_backbone(x))
+        else:
+            batch[_PREDS] = super().predict_step((batch[_INPUT]), batch_idx, dataloader_idx=dataloader_idx)
         return batch
 
+    def on_fit_start(self) -> None:
+        super().on_fit_start()
+        if self._quantized_backbone is not None:
+            rank_zero_warn(
+                "The quantized backbone is out of date once the model is trained further and has been discarded, call "
+                "`quantize` again after training to use it.",
+                UserWarning,
+            )
+            self.__dict__["_quantized_backbone"] = None
+
+    def on_predict_start(self) -> None:
+        super().on_predict_start()
+        if self._quantized_backbone is not None:
+            if self.device.type == "cpu":
+                self._set_predict_backbone(self._quantized_backbone)
+                return
+            rank_zero_warn(
+                "The quantized backbone can only be used on the CPU, the float backbone will be used instead.",
+                UserWarning,
+            )
+        self._set_predict_backbone(self._freeze_backbone())
+
+    def on_predict_end(self) -> None:
+        self._set_predict_backbone(None)
+        super().on_predict_end()
+
+    def _set_predict_backbone(self, backbone: Optional[nn.Module]) -> None:
+        # stored outside of ``_modules`` so that it never ends up in the ``state_dict``
+        self.__dict__["_predict_backbone"] = backbone
+
+    def _freeze_backbone(self) -> Optional[nn.Module]:
+        """Script and freeze the backbone for inference. Freezing inlines the weights and folds batch norm layers
+        into the preceding convolutions. Returns ``None`` if the backbone can't be scripted, in which case the eager
+        backbone will be used."""
+        try:
+            return torch.jit.freeze(torch.jit.script(self.backbone.eval()))
+        except Exception as e:
+            rank_zero_warn(
+                f"Failed to script the backbone for inference, the eager backbone will be used instead. Error: {e}",
+                UserWarning,
+            )
+            return None
+
+    def quantize(self, calibration_data: Iterable[Any], backend: str = "fbgemm") -> None:
+        """Apply static ``int8`` post-training quantization to a copy of the backbone, which will then be used when
+        predicting on the CPU with a :class:`~flash.core.trainer.Trainer`. Training and evaluation are unaffected.
+
+        .. note:: This sets ``torch.backends.quantized.engine`` to ``backend`` for the whole process, since the
+            quantized backbone must run with the engine it was prepared for.
+
+        Args:
+            calibration_data: An iterable of batches used to calibrate the ranges of the activations, e.g. one of the
+                dataloaders of an :class:`~flash.image.ImageClassificationData`. Each batch can either be a tensor or a
+                dictionary containing the inputs under ``DefaultDataKeys.INPUT``. Batches of ``uint8`` images (as
+                produced by the default transforms) are converted to float and normalized with the predict
+                ``per_batch_transform_on_device`` of the attached preprocess (or the default ImageNet normalization).
+            backend: The quantized engine to use. Either ``"fbgemm"`` (x86) or ``"qnnpack"`` (ARM).
+        """
+        from torch.quantization import quantize_fx
+
+        normalize = None
+        if self._preprocess is not None and self._preprocess.predict_transform:
+            normalize = self._preprocess.predict_transform.get("per_batch_transform_on_device")
+        normalize = normalize or normalize_transform()
+
+        def to_input(batch: Any) -> torch.Tensor:
+            x = (batch[_INPUT] if isinstance(batch, Mapping) else batch).cpu()
+            if not x.is_floating_point():
+                # the default transforms only convert the images to float on the device, after the ``DataLoader``
+                x = normalize({_INPUT: x})[_INPUT]
+            return x
+
+        batches = iter(calibration_data)
+        first_batch = to_input(next(batches))
+
+        torch.backends.quantized.engine = backend
+        qconfig_dict = {"": torch.quantization.get_default_qconfig(backend)}
+        prepare_kwargs = {}
+        if "example_inputs" in signature(quantize_fx.prepare_fx).parameters:
+            # required from PyTorch 1.13
+            prepare_kwargs["example_inputs"] = (first_batch,)
+        backbone = quantize_fx.prepare_fx(deepcopy(self.backbone).cpu().eval(), qconfig_dict, **prepare_kwargs)
+        with torch.no_grad():
+            for batch in chain([first_batch], map(to_input, batches)):
+                backbone(batch)
+        self.__dict__["_quantized_backbone"] = quantize_fx.convert_fx(backbone)
+
     def forward(self, x) -> torch.Tensor:
-        x = self.backbone(x)
+        if x.dim() == 4:
+            x = x.contiguous(memory_format=torch.channels_last)
+        return self._forward_head(self.backbone(x))
+
+    def _forward_head(self, x: torch.Tensor) -> torch.Tensor:
         if x.dim() == 4:
             x = x.mean(-1).mean(-1)
         return self.head(x)
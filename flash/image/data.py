@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import base64
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -29,11 +30,17 @@ from flash.core.data.data_source import (
     TensorDataSource,
 )
 from flash.core.data.process import Deserializer
-from flash.core.utilities.imports import _PIL_AVAILABLE, _TORCHVISION_AVAILABLE, requires_extras
+from flash.core.utilities.imports import (
+    _JPEG4PY_AVAILABLE,
+    _PIL_AVAILABLE,
+    _TORCHVISION_AVAILABLE,
+    _TURBOJPEG_AVAILABLE,
+    requires_extras,
+)
 
 if _TORCHVISION_AVAILABLE:
     import torchvision
-    from torchvision.datasets.folder import default_loader, IMG_EXTENSIONS
+    from torchvision.datasets.folder import IMG_EXTENSIONS
     from torchvision.transforms.functional import to_pil_image
 else:
     IMG_EXTENSIONS = ()
@@ -46,12 +53,66 @@ else:
         Image = None
 
 
+if _JPEG4PY_AVAILABLE:
+    import jpeg4py
+
+if _TURBOJPEG_AVAILABLE:
+    from turbojpeg import TJPF_RGB, TurboJPEG
+
 NP_EXTENSIONS = (".npy", ".npz")
+JPEG_EXTENSIONS = (".jpg", ".jpeg")
+
+
+@lru_cache(maxsize=None)
+def _turbo_jpeg() -> Optional["TurboJPEG"]:
+    """Returns a process wide ``TurboJPEG`` decoder, or ``None`` if the ``libturbojpeg`` library can't be found."""
+    try:
+        return TurboJPEG()
+    except (OSError, RuntimeError):
+        return None
+
+
+def _decode_jpeg(filepath: str) -> Optional[np.ndarray]:
+    """Decode the JPEG file at the given path to an RGB ``np.ndarray`` using ``libjpeg-turbo`` directly, through
+    ``PyTurboJPEG`` or ``jpeg4py`` (whichever is available). Returns ``None`` if neither is available or if the file
+    can't be decoded by them (e.g. CMYK JPEGs)."""
+    turbo_jpeg = _turbo_jpeg() if _TURBOJPEG_AVAILABLE else None
+    if turbo_jpeg is not None:
+        try:
+            with open(filepath, "rb") as f:
+                return turbo_jpeg.decode(f.read(), pixel_format=TJPF_RGB)
+        except OSError:
+            pass
+    if _JPEG4PY_AVAILABLE:
+        try:
+            return jpeg4py.JPEG(filepath).decode()
+        except (jpeg4py.JPEGRuntimeError, ValueError, OSError):
+            # ``OSError`` is raised when the ``libturbojpeg`` library (loaded on first use) can't be found
+            pass
+    return None
+
+
+def _load_image(filepath: str) -> "PILImage.Image":
+    """Load the image at the given path as an RGB ``PIL.Image``.
+
+    This reads the file with PIL directly rather than going through ``torchvision``'s backend dispatch. When
+    `Pillow-SIMD <https://github.com/uploadcare/pillow-simd>`_ built against ``libjpeg-turbo`` is installed in place of
+    Pillow, decoding here uses its SIMD code paths with no further changes. If ``PyTurboJPEG`` or ``jpeg4py`` is
+    installed, JPEG files are instead decoded directly with ``libjpeg-turbo`` (which releases the GIL), falling back to
+    PIL for files they can't handle.
+    """
+    if has_file_allowed_extension(filepath, JPEG_EXTENSIONS):
+        img = _decode_jpeg(filepath)
+        if img is not None:
+            return PILImage.fromarray(img)
+    with open(filepath, "rb") as f:
+        img = PILImage.open(f)
+        return img.convert("RGB")
 
 
 def image_loader(filepath: str):
     if has_file_allowed_extension(filepath, IMG_EXTENSIONS):
-        img = default_loader(filepath)
+        img = _load_image(filepath)
     elif has_file_allowed_extension(filepath, NP_EXTENSIONS):
         img = PILImage.fromarray(np.load(filepath).astype("uint8"), "RGB")
     else:
@@ -117,7 +178,7 @@ class ImageFiftyOneDataSource(FiftyOneDataSource):
     @staticmethod
     def load_sample(sample: Dict[str, Any], dataset: Optional[Any] = None) -> Dict[str, Any]:
         img_path = sample[DefaultDataKeys.INPUT]
-        img = default_loader(img_path)
+        img = _load_image(img_path)
         sample[DefaultDataKeys.INPUT] = img
         w, h = img.size  # WxH
         sample[DefaultDataKeys.METADATA] = {
@@ -12,7 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-from typing import Any, Callable, Dict, Optional, Sequence, Tuple, TYPE_CHECKING
+import platform
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
+import torch
 
 from flash.core.data.callback import BaseDataFetcher
 from flash.core.data.data_module import DataModule
@@ -21,26 +28,128 @@ from flash.core.data.process import Preprocess
 from flash.core.utilities.imports import (
     _COCO_AVAILABLE,
     _FIFTYONE_AVAILABLE,
-    _TORCHVISION_AVAILABLE,
+    _NUMBA_AVAILABLE,
+    _ORJSON_AVAILABLE,
     lazy_import,
     requires,
 )
-from flash.image.data import ImagePathsDataSource
+from flash.image.data import _load_image, ImagePathsDataSource
 from flash.image.detection.transforms import default_transforms
 
 if _COCO_AVAILABLE:
     from pycocotools.coco import COCO
 
+if _ORJSON_AVAILABLE:
+    import orjson
+
 SampleCollection = None
 if _FIFTYONE_AVAILABLE:
+    foa = lazy_import("fiftyone.core.aggregations")
     fol = lazy_import("fiftyone.core.labels")
     if TYPE_CHECKING:
         from fiftyone.core.collections import SampleCollection
 else:
-    foc, fol = None, None
+    foa, foc, fol = None, None, None
+
+
+def _reformat_boxes_kernel(boxes: np.ndarray, width: float, height: float) -> Tuple[np.ndarray, np.ndarray]:
+    """A single loop version of ``_reformat_boxes`` to be compiled with ``numba``."""
+    output_boxes = np.empty_like(boxes)
+    output_areas = np.empty(boxes.shape[0], dtype=boxes.dtype)
+    for i in range(boxes.shape[0]):
+        xmin = boxes[i, 0] * width
+        ymin = boxes[i, 1] * height
+        box_w = boxes[i, 2] * width
+        box_h = boxes[i, 3] * height
+        output_boxes[i, 0] = xmin
+        output_boxes[i, 1] = ymin
+        output_boxes[i, 2] = xmin + box_w
+        output_boxes[i, 3] = ymin + box_h
+        output_areas[i] = box_w * box_h
+    return output_boxes, output_areas
+
+
+@lru_cache(maxsize=None)
+def _compiled_reformat_boxes_kernel() -> Callable:
+    # ``numba`` is only imported (and the kernel compiled) on first use so that it doesn't slow down ``import flash``
+    from numba import njit
+
+    return njit(cache=True, fastmath=True)(_reformat_boxes_kernel)
+
+
+def _reformat_boxes_numba(boxes: np.ndarray, width: float, height: float) -> Tuple[np.ndarray, np.ndarray]:
+    return _compiled_reformat_boxes_kernel()(boxes, np.float32(width), np.float32(height))
 
-if _TORCHVISION_AVAILABLE:
-    from torchvision.datasets.folder import default_loader
+
+# The number of boxes in a single sample above which the fused ``numba`` kernel is used (if available) to reformat
+# them. Below it, the NumPy version is faster.
+_NUMBA_BOXES_THRESHOLD = 1024
+
+
+def _reformat_boxes(boxes: List[List[float]], width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert relative ``[x, y, width, height]`` boxes to absolute ``[xmin, ymin, xmax, ymax]`` boxes and compute
+    their areas."""
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+    if _NUMBA_AVAILABLE and boxes.shape[0] > _NUMBA_BOXES_THRESHOLD:
+        return _reformat_boxes_numba(boxes, width, height)
+    boxes *= np.array([width, height, width, height], dtype=np.float32)
+    areas = boxes[:, 2] * boxes[:, 3]
+    boxes[:, 2:] += boxes[:, :2]
+    return boxes, areas
+
+
+def _parse_coco(ann_file: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[int, List[Dict[str, Any]]]]:
+    """Read a COCO annotation file and return the categories, the images (sorted by id), and the annotations grouped
+    by image id.
+
+    If ``orjson`` is installed, the file is parsed with it and indexed directly, which is several times faster than
+    building the full ``pycocotools`` index for large datasets.
+    """
+    if not _ORJSON_AVAILABLE:
+        coco = COCO(ann_file)
+        categories = coco.loadCats(coco.getCatIds())
+        images = coco.loadImgs(sorted(coco.imgs.keys()))
+        return categories, images, coco.imgToAnns
+
+    with open(ann_file, "rb") as f:
+        dataset = orjson.loads(f.read())
+
+    annotations = defaultdict(list)
+    for annotation in dataset.get("annotations", []):
+        annotations[annotation["image_id"]].append(annotation)
+    images = sorted(dataset.get("images", []), key=lambda image: image["id"])
+    return dataset.get("categories", []), images, annotations
+
+
+def _build_coco_sample(
+    image: Dict[str, Any], annotations: List[Dict[str, Any]], root: str, training: bool
+) -> Optional[Dict[str, Any]]:
+    """Build the sample for a single COCO image, or return ``None`` if it should be skipped."""
+    boxes = np.array([annotation["bbox"] for annotation in annotations], dtype=np.float32).reshape(-1, 4)
+
+    # Ref: https://github.com/pytorch/vision/blob/master/references/detection/coco_utils.py
+    if training and (boxes[:, 2:] <= 1).any(axis=1).all():
+        return None
+
+    # Convert the [x, y, width, height] boxes to [xmin, ymin, xmax, ymax] and drop the degenerate ones
+    boxes[:, 2:] += boxes[:, :2]
+    keep = (boxes[:, 3] > boxes[:, 1]) & (boxes[:, 2] > boxes[:, 0])
+
+    num_annotations = len(annotations)
+    labels = np.fromiter((annotation["category_id"] for annotation in annotations), np.int64, num_annotations)
+    areas = np.fromiter((annotation["area"] for annotation in annotations), np.float32, num_annotations)
+    iscrowds = np.fromiter((annotation["iscrowd"] for annotation in annotations), np.uint8, num_annotations)
+
+    return dict(
+        input=os.path.join(root, image["file_name"]),
+        target=dict(
+            boxes=boxes[keep],
+            labels=labels[keep],
+            image_id=image["id"],
+            area=areas[keep],
+            iscrowd=iscrowds[keep],
+        ),
+    )
 
 
 class COCODataSource(DataSource[Tuple[str, str]]):
@@ -48,60 +157,16 @@ class COCODataSource(DataSource[Tuple[str, str]]):
     def load_data(self, data: Tuple[str, str], dataset: Optional[Any] = None) -> Sequence[Dict[str, Any]]:
         root, ann_file = data
 
-        coco = COCO(ann_file)
-
-        categories = coco.loadCats(coco.getCatIds())
+        categories, images, annotations = _parse_coco(ann_file)
         if categories:
             dataset.num_classes = categories[-1]["id"] + 1
 
-        img_ids = list(sorted(coco.imgs.keys()))
-        paths = coco.loadImgs(img_ids)
-
-        data = []
-
-        for img_id, path in zip(img_ids, paths):
-            path = path["file_name"]
-
-            ann_ids = coco.getAnnIds(imgIds=img_id)
-            annotations = coco.loadAnns(ann_ids)
-
-            boxes, labels, areas, iscrowd = [], [], [], []
-
-            # Ref: https://github.com/pytorch/vision/blob/master/references/detection/coco_utils.py
-            if self.training and all(any(o <= 1 for o in obj["bbox"][2:]) for obj in annotations):
-                continue
-
-            for obj in annotations:
-                xmin = obj["bbox"][0]
-                ymin = obj["bbox"][1]
-                xmax = xmin + obj["bbox"][2]
-                ymax = ymin + obj["bbox"][3]
-
-                bbox = [xmin, ymin, xmax, ymax]
-                keep = (bbox[3] > bbox[1]) & (bbox[2] > bbox[0])
-                if keep:
-                    boxes.append(bbox)
-                    labels.append(obj["category_id"])
-                    areas.append(obj["area"])
-                    iscrowd.append(obj["iscrowd"])
-
-            data.append(
-                dict(
-                    input=os.path.join(root, path),
-                    target=dict(
-                        boxes=boxes,
-                        labels=labels,
-                        image_id=img_id,
-                        area=areas,
-                        iscrowd=iscrowd,
-                    ),
-                )
-            )
-        return data
+        data = (_build_coco_sample(image, annotations.get(image["id"], []), root, self.training) for image in images)
+        return [sample for sample in data if sample is not None]
 
     def load_sample(self, sample: Dict[str, Any]) -> Dict[str, Any]:
         filepath = sample[DefaultDataKeys.INPUT]
-        img = default_loader(filepath)
+        img = _load_image(filepath)
         sample[DefaultDataKeys.INPUT] = img
         w, h = img.size  # WxH
         sample[DefaultDataKeys.METADATA] = {
@@ -111,6 +176,37 @@ class COCODataSource(DataSource[Tuple[str, str]]):
         return sample
 
 
+# The number of samples above which FiftyOne annotations are converted in parallel (below it, starting the worker
+# processes would take longer than the conversion itself)
+_PARALLEL_LOAD_THRESHOLD = 10000
+
+
+def _build_fiftyone_sample(
+    filepath: str,
+    width: int,
+    height: int,
+    labels: List[str],
+    boxes: List[List[float]],
+    iscrowds: List[Optional[int]],
+    img_id: int,
+    class_to_idx: Dict[str, int],
+) -> Dict[str, Any]:
+    """Convert the detections of a single FiftyOne sample to a detection sample. This is a module level function so
+    that it can be sent to worker processes."""
+    output_boxes, output_areas = _reformat_boxes(boxes, width, height)
+    # Targets are stored as arrays rather than lists, so they are converted to tensors without a copy
+    return dict(
+        input=filepath,
+        target=dict(
+            boxes=output_boxes,
+            labels=np.fromiter((class_to_idx[label] for label in labels), dtype=np.int64, count=len(labels)),
+            image_id=img_id,
+            area=output_areas,
+            iscrowd=np.array([0 if iscrowd is None else iscrowd for iscrowd in iscrowds], dtype=np.uint8),
+        ),
+    )
+
+
 class ObjectDetectionFiftyOneDataSource(FiftyOneDataSource):
     def __init__(self, label_field: str = "ground_truth", iscrowd: str = "iscrowd"):
         super().__init__(label_field=label_field)
@@ -123,57 +219,43 @@ class ObjectDetectionFiftyOneDataSource(FiftyOneDataSource):
     def load_data(self, data: SampleCollection, dataset: Optional[Any] = None) -> Sequence[Dict[str, Any]]:
         self._validate(data)
 
-        data.compute_metadata()
-
-        filepaths = data.values("filepath")
-        widths = data.values("metadata.width")
-        heights = data.values("metadata.height")
-        labels = data.values(self.label_field + ".detections.label")
-        bboxes = data.values(self.label_field + ".detections.bounding_box")
-        iscrowds = data.values(self.label_field + ".detections." + self.iscrowd)
+        # Only open the images whose dimensions aren't already known
+        missing_metadata = data.exists("metadata.width", False)
+        if missing_metadata.count() > 0:
+            missing_metadata.compute_metadata()
+
+        # Batch the reads into a single aggregation so that the collection is only scanned once
+        detections = self.label_field + ".detections."
+        filepaths, widths, heights, labels, bboxes, iscrowds = data.aggregate(
+            [
+                foa.Values(field)
+                for field in (
+                    "filepath",
+                    "metadata.width",
+                    "metadata.height",
+                    detections + "label",
+                    detections + "bounding_box",
+                    detections + self.iscrowd,
+                )
+            ]
+        )
 
-        classes = self._get_classes(data)
-        class_to_idx = {cls_name: i for i, cls_name in enumerate(classes)}
+        classes, class_to_idx = self._get_class_to_idx(data)
         if dataset is not None:
             dataset.num_classes = len(classes)
 
-        output_data = []
-        img_id = 1
-        for fp, w, h, sample_labs, sample_boxes, sample_iscrowd in zip(
-            filepaths, widths, heights, labels, bboxes, iscrowds
-        ):
-            output_boxes = []
-            output_labs = []
-            output_iscrowd = []
-            output_areas = []
-            for lab, box, iscrowd in zip(sample_labs, sample_boxes, sample_iscrowd):
-                output_box, output_area = self._reformat_bbox(box[0], box[1], box[2], box[3], w, h)
-                output_areas.append(output_area)
-                output_labs.append(class_to_idx[lab])
-                output_boxes.append(output_box)
-                if iscrowd is None:
-                    iscrowd = 0
-                output_iscrowd.append(iscrowd)
-            output_data.append(
-                dict(
-                    input=fp,
-                    target=dict(
-                        boxes=output_boxes,
-                        labels=output_labs,
-                        image_id=img_id,
-                        area=output_areas,
-                        iscrowd=output_iscrowd,
-                    ),
-                )
-            )
-            img_id += 1
-
-        return output_data
+        args = (filepaths, widths, heights, labels, bboxes, iscrowds, range(1, len(filepaths) + 1))
+        build_sample = partial(_build_fiftyone_sample, class_to_idx=class_to_idx)
+        if len(filepaths) > _PARALLEL_LOAD_THRESHOLD:
+            workers = os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(build_sample, *args, chunksize=max(1, len(filepaths) // (4 * workers))))
+        return list(map(build_sample, *args))
 
     @staticmethod
     def load_sample(sample: Dict[str, Any], dataset: Optional[Any] = None) -> Dict[str, Any]:
         filepath = sample[DefaultDataKeys.INPUT]
-        img = default_loader(filepath)
+        img = _load_image(filepath)
         sample[DefaultDataKeys.INPUT] = img
         w, h = img.size  # WxH
         sample[DefaultDataKeys.METADATA] = {
@@ -228,9 +310,26 @@ class ObjectDetectionPreprocess(Preprocess):
         return default_transforms()
 
 
+def _auto_num_workers() -> int:
+    """The default number of workers for object detection: an equal share of the CPUs for each GPU (each of which
+    will have its own loader when training on several devices), capped at 8 since throughput plateaus beyond that.
+    As in the :class:`~flash.core.data.data_module.DataModule`, no workers are used on macOS and Windows."""
+    if platform.system() in ("Darwin", "Windows"):
+        return 0
+    num_devices = torch.cuda.device_count() if torch.cuda.is_available() else 1
+    return max(1, min(8, (os.cpu_count() or 1) // max(1, num_devices)))
+
+
 class ObjectDetectionData(DataModule):
 
     preprocess_cls = ObjectDetectionPreprocess
+    persistent_workers = True
+
+    def __init__(self, *args, num_workers: Optional[int] = None, **kwargs):
+        # Resolved here so that the default applies to all of the ``from_*`` methods
+        if num_workers is None:
+            num_workers = _auto_num_workers()
+        super().__init__(*args, num_workers=num_workers, **kwargs)
 
     @classmethod
     @requires("pycocotools")
@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from copy import deepcopy
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Type, Union
 
 import torch
@@ -38,6 +40,35 @@ if _TORCHVISION_AVAILABLE:
         "retinanet": torchvision.models.detection.retinanet_resnet50_fpn,
     }
 
+    def _build_model(
+        model_name: str, pretrained: bool, pretrained_backbone: bool, trainable_backbone_layers: int
+    ) -> nn.Module:
+        if model_name == "fasterrcnn":
+            return _models[model_name](
+                pretrained=pretrained,
+                pretrained_backbone=pretrained_backbone,
+                trainable_backbone_layers=trainable_backbone_layers,
+            )
+        return _models[model_name](pretrained=pretrained, pretrained_backbone=pretrained_backbone)
+
+    # Each cached model holds a full set of COCO weights (around 160MB), so only the two most recently used
+    # configurations are kept. The cached models are never handed out directly, ``_load_model`` copies them.
+    @lru_cache(maxsize=2)
+    def _pretrained_model(model_name: str, pretrained_backbone: bool, trainable_backbone_layers: int) -> nn.Module:
+        return _build_model(model_name, True, pretrained_backbone, trainable_backbone_layers)
+
+    def _load_model(
+        model_name: str, pretrained: bool, pretrained_backbone: bool, trainable_backbone_layers: int
+    ) -> nn.Module:
+        """Build a fresh model, copying the cached COCO pretrained model if required.
+
+        Models which aren't fully pretrained are always built from scratch so that their randomly initialized layers
+        still depend on the random seed.
+        """
+        if pretrained:
+            return deepcopy(_pretrained_model(model_name, pretrained_backbone, trainable_backbone_layers))
+        return _build_model(model_name, pretrained, pretrained_backbone, trainable_backbone_layers)
+
 else:
     AnchorGenerator = None
 
@@ -95,7 +126,7 @@ class ObjectDetector(Task):
         serializer: Optional[Union[Serializer, Mapping[str, Serializer]]] = None,
         **kwargs: Any,
     ):
-        self.save_hyperparameters()
+        self.save_hyperparameters(ignore=["metrics", "optimizer", "serializer"])
 
         if model in _models:
             model = ObjectDetector.get_model(
@@ -135,17 +166,12 @@ class ObjectDetector(Task):
     ):
         if backbone is None:
             # Constructs a model with a ResNet-50-FPN backbone when no backbone is specified.
+            model = _load_model(model_name, pretrained, pretrained_backbone, trainable_backbone_layers)
             if model_name == "fasterrcnn":
-                model = _models[model_name](
-                    pretrained=pretrained,
-                    pretrained_backbone=pretrained_backbone,
-                    trainable_backbone_layers=trainable_backbone_layers,
-                )
                 in_features = model.roi_heads.box_predictor.cls_score.in_features
                 head = FastRCNNPredictor(in_features, num_classes)
                 model.roi_heads.box_predictor = head
             else:
-                model = _models[model_name](pretrained=pretrained, pretrained_backbone=pretrained_backbone)
                 model.head = RetinaNetHead(
                     in_channels=model.backbone.out_channels,
                     num_anchors=model.head.classification_head.num_anchors,
@@ -108,6 +108,7 @@ class StyleTransferPreprocess(Preprocess):
 
 class StyleTransferData(ImageClassificationData):
     preprocess_cls = StyleTransferPreprocess
+    persistent_workers = True
 
     @classmethod
     def from_folders(
@@ -164,6 +164,7 @@ class PointCloudObjectDetector(Task):
         drop_last: bool = True,
         sampler: Optional[Sampler] = None,
         convert_to_dataloader: bool = True,
+        persistent_workers: bool = False,
     ) -> Union[DataLoader, BaseAutoDataset]:
 
         if not _POINTCLOUD_AVAILABLE:
@@ -182,6 +183,7 @@ class PointCloudObjectDetector(Task):
                 shuffle=shuffle,
                 drop_last=drop_last,
                 sampler=sampler,
+                persistent_workers=persistent_workers,
             )
 
         else:
@@ -193,6 +193,7 @@ class PointCloudSegmentation(ClassificationTask):
         drop_last: bool = True,
         sampler: Optional[Sampler] = None,
         convert_to_dataloader: bool = True,
+        persistent_workers: bool = False,
     ) -> Union[DataLoader, BaseAutoDataset]:
 
         if not _POINTCLOUD_AVAILABLE:
@@ -217,6 +218,7 @@ class PointCloudSegmentation(ClassificationTask):
                 shuffle=shuffle,
                 drop_last=drop_last,
                 sampler=sampler,
+                persistent_workers=persistent_workers,
             )
 
         else:
@@ -11,7 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from flash.core.data.data_source import DatasetDataSource, DefaultDataKeys
+import gc
+
+import pytest
+
+from flash.core.data.data_source import DatasetDataSource, DefaultDataKeys, FiftyOneDataSource
+from flash.core.utilities.imports import _FIFTYONE_AVAILABLE
+
+if _FIFTYONE_AVAILABLE:
+    import fiftyone as fo
 
 
 def test_dataset_data_source():
@@ -21,3 +29,39 @@ def test_dataset_data_source():
 
     assert data_source.load_sample((input, target)) == {DefaultDataKeys.INPUT: input, DefaultDataKeys.TARGET: target}
     assert data_source.load_sample(input) == {DefaultDataKeys.INPUT: input}
+
+
+@pytest.mark.skipif(not _FIFTYONE_AVAILABLE, reason="fiftyone is not installed for testing")
+def test_fiftyone_data_source_classes_cache():
+    FiftyOneDataSource.clear_classes_cache()
+
+    dataset = fo.Dataset()
+    dataset.add_samples(
+        [
+            fo.Sample(filepath="a.png", ground_truth=fo.Classification(label="b")),
+            fo.Sample(filepath="b.png", ground_truth=fo.Classification(label="a")),
+        ]
+    )
+    view = dataset.view()
+    data_source = FiftyOneDataSource()
+
+    # miss: the classes are found by scanning the labels
+    classes, class_to_idx = data_source._get_class_to_idx(view)
+    assert (classes, class_to_idx) == (["a", "b"], {"a": 0, "b": 1})
+    assert len(FiftyOneDataSource._classes_cache) == 1
+
+    # hit: new labels aren't picked up until the cache is cleared
+    dataset.add_sample(fo.Sample(filepath="c.png", ground_truth=fo.Classification(label="c")))
+    assert data_source._get_class_to_idx(view)[1] is class_to_idx
+
+    FiftyOneDataSource.clear_classes_cache()
+    assert not FiftyOneDataSource._classes_cache
+    assert data_source._get_class_to_idx(view) == (["a", "b", "c"], {"a": 0, "b": 1, "c": 2})
+    assert len(FiftyOneDataSource._classes_cache) == 1
+
+    # entries are evicted when their collection is garbage collected
+    del view
+    gc.collect()
+    assert not FiftyOneDataSource._classes_cache
+
+    dataset.delete()
@@ -13,6 +13,7 @@
 # limitations under the License.
 import platform
 
+import pytest
 import torch
 
 from flash import DataModule
@@ -58,3 +59,16 @@ def test_cpu_count_none():
         assert dm.num_workers == 0
     else:
         assert dm.num_workers > 0
+
+
+@pytest.mark.parametrize("persistent_workers", [False, True])
+@pytest.mark.parametrize("num_workers", [0, 1])
+def test_persistent_workers(num_workers, persistent_workers):
+    train_ds, val_ds, test_ds = DummyDataset(), DummyDataset(), DummyDataset()
+    dm = DataModule(train_ds, val_ds, test_ds, num_workers=num_workers)
+    dm.persistent_workers = persistent_workers
+
+    expected = persistent_workers and num_workers > 0
+    assert dm.train_dataloader().persistent_workers is expected
+    assert dm.val_dataloader().persistent_workers is expected
+    assert dm.test_dataloader().persistent_workers is False
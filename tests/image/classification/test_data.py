@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import csv
+import tarfile
 from pathlib import Path
 from typing import Any, List, Tuple
 
@@ -20,7 +21,8 @@ import pytest
 import torch
 import torch.nn as nn
 
-from flash.core.data.data_source import DefaultDataKeys
+from flash.core.data.auto_dataset import IterableAutoDataset
+from flash.core.data.data_source import DefaultDataKeys, LabelsState
 from flash.core.data.transforms import ApplyToKeys
 from flash.core.utilities.imports import (
     _FIFTYONE_AVAILABLE,
@@ -28,8 +30,10 @@ from flash.core.utilities.imports import (
     _MATPLOTLIB_AVAILABLE,
     _PIL_AVAILABLE,
     _TORCHVISION_AVAILABLE,
+    _WEBDATASET_AVAILABLE,
 )
 from flash.image import ImageClassificationData
+from flash.image.classification.data import pack_folders_to_tar
 from tests.helpers.utils import _IMAGE_TESTING
 
 if _TORCHVISION_AVAILABLE:
@@ -569,3 +573,71 @@ def test_from_bad_csv_no_image(bad_csv_no_image):
             num_workers=0,
         )
         _ = next(iter(img_data.train_dataloader()))
+
+
+def _create_class_folders(root: Path, num_images: Tuple[int, int] = (2, 2)) -> Path:
+    folder = root / "train"
+    for class_name, num in zip(("a", "b"), num_images):
+        (folder / class_name).mkdir(parents=True)
+        for index in range(num):
+            _rand_image((196, 196)).save(folder / class_name / f"{index}.png")
+    return folder
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+def test_pack_folders_to_tar(tmpdir):
+    train_dir = _create_class_folders(Path(tmpdir), num_images=(2, 1))
+
+    shards, classes = pack_folders_to_tar(str(train_dir), str(tmpdir / "train-%06d.tar"), samples_per_shard=2)
+    assert len(shards) == 2
+    assert classes == ["a", "b"]
+
+    names = []
+    for shard in shards:
+        with tarfile.open(shard) as tar:
+            names += tar.getnames()
+    assert sorted(names) == [f"{i:09d}.{ext}" for i in range(3) for ext in ("cls", "png")]
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+def test_pack_folders_to_tar_symlinks(tmpdir):
+    train_dir = _create_class_folders(Path(tmpdir), num_images=(1, 0))
+    image_path = train_dir / "a" / "0.png"
+    (train_dir / "b" / "0.png").symlink_to(image_path)
+
+    shards, _ = pack_folders_to_tar(str(train_dir), str(tmpdir / "train-%06d.tar"), shuffle=False)
+
+    with tarfile.open(shards[0]) as tar:
+        members = [member for member in tar.getmembers() if member.name.endswith(".png")]
+        assert len(members) == 2
+        for member in members:
+            assert member.isfile()
+            assert tar.extractfile(member).read() == image_path.read_bytes()
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+@pytest.mark.skipif(not _WEBDATASET_AVAILABLE, reason="webdataset isn't installed.")
+def test_from_webdataset(tmpdir):
+    train_dir = _create_class_folders(Path(tmpdir))
+
+    shards, classes = pack_folders_to_tar(str(train_dir), str(tmpdir / "train-%06d.tar"), shuffle=False)
+
+    img_data = ImageClassificationData.from_webdataset(
+        shards, val_shards=shards, classes=classes, batch_size=2, num_workers=0
+    )
+
+    # the WebDataset pipeline has no length, so it must be streamed
+    assert isinstance(img_data.train_dataset, IterableAutoDataset)
+    assert isinstance(img_data.val_dataset, IterableAutoDataset)
+    assert img_data.num_classes == 2
+    assert img_data.train_dataset.data_source.get_state(LabelsState).labels == ["a", "b"]
+
+    data = next(iter(img_data.train_dataloader()))
+    imgs, labels = data[DefaultDataKeys.INPUT], data[DefaultDataKeys.TARGET]
+    assert imgs.shape == (2, 3, 196, 196)
+    assert labels.shape == (2,)
+
+    data = next(iter(img_data.val_dataloader()))
+    imgs, labels = data[DefaultDataKeys.INPUT], data[DefaultDataKeys.TARGET]
+    assert imgs.shape == (2, 3, 196, 196)
+    assert list(labels.numpy()) == [0, 0]
@@ -25,6 +25,7 @@ from flash.core.data.data_source import DefaultDataKeys
 from flash.core.utilities.imports import _IMAGE_AVAILABLE
 from flash.image import ImageClassifier
 from flash.image.classification.data import ImageClassificationPreprocess
+from flash.image.classification.transforms import normalize_transform
 from tests.helpers.utils import _IMAGE_TESTING, _SERVE_TESTING
 
 # ======== Mock functions ========
@@ -134,6 +135,82 @@ def test_jit(tmpdir, jitter, args):
     assert out.shape == torch.Size([1, 2])
 
 
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+def test_predict_frozen_backbone():
+    model = ImageClassifier(2, backbone="resnet18", pretrained=False)
+    model.eval()
+    x = torch.rand(2, 3, 32, 32)
+
+    model.on_predict_start()
+    assert model._predict_backbone is not None
+    out = model.predict_step({DefaultDataKeys.INPUT: x.clone()}, 0)
+    model.on_predict_end()
+
+    assert model._predict_backbone is None
+    with torch.no_grad():
+        assert torch.allclose(out[DefaultDataKeys.PREDS], model(x), atol=1e-4)
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+def test_predict_frozen_backbone_fallback(monkeypatch):
+    def failing_script(*args, **kwargs):
+        raise RuntimeError("Can't script this backbone")
+
+    model = ImageClassifier(2, backbone="resnet18", pretrained=False)
+    model.eval()
+    x = torch.rand(2, 3, 32, 32)
+    monkeypatch.setattr(torch.jit, "script", failing_script)
+
+    with pytest.warns(UserWarning, match="Failed to script the backbone"):
+        model.on_predict_start()
+    assert model._predict_backbone is None
+    out = model.predict_step({DefaultDataKeys.INPUT: x.clone()}, 0)
+    model.on_predict_end()
+
+    with torch.no_grad():
+        assert torch.allclose(out[DefaultDataKeys.PREDS], model(x))
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+def test_quantize():
+    model = ImageClassifier(2, backbone="resnet18", pretrained=False)
+    model.eval()
+    calibration_data = [torch.rand(4, 3, 32, 32) for _ in range(4)]
+    model.quantize([calibration_data[0], *({DefaultDataKeys.INPUT: x} for x in calibration_data[1:])])
+
+    x = calibration_data[0][:2]
+    model.on_predict_start()
+    out = model.predict_step({DefaultDataKeys.INPUT: x.clone()}, 0)
+    model.on_predict_end()
+
+    with torch.no_grad():
+        expected = model(x)
+    assert out[DefaultDataKeys.PREDS].shape == expected.shape == torch.Size([2, 2])
+    # int8 quantization is lossy, so only check that the outputs stay close to the float model
+    assert torch.allclose(out[DefaultDataKeys.PREDS], expected, atol=0.1 * expected.abs().max().item() + 0.05)
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+def test_quantize_uint8_batches():
+    model = ImageClassifier(2, backbone="resnet18", pretrained=False)
+    model.eval()
+    images = torch.randint(255, (4, 3, 32, 32), dtype=torch.uint8)
+    model.quantize([{DefaultDataKeys.INPUT: images}])
+
+    x = normalize_transform()({DefaultDataKeys.INPUT: images})[DefaultDataKeys.INPUT]
+    model.on_predict_start()
+    out = model.predict_step({DefaultDataKeys.INPUT: x.clone()}, 0)
+    model.on_predict_end()
+
+    with torch.no_grad():
+        expected = model(x)
+    assert torch.allclose(out[DefaultDataKeys.PREDS], expected, atol=0.1 * expected.abs().max().item() + 0.05)
+
+    with pytest.warns(UserWarning, match="quantized backbone is out of date"):
+        model.on_fit_start()
+    assert model._quantized_backbone is None
+
+
 @pytest.mark.skipif(not _SERVE_TESTING, reason="serve libraries aren't installed.")
 @mock.patch("flash._IS_TESTING", True)
 def test_serve():
@@ -0,0 +1,73 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+import torch
+from torch.utils.data import DataLoader
+
+from flash.core.data.data_source import DefaultDataKeys
+from flash.image.classification.transforms import _collate
+from tests.helpers.utils import _IMAGE_TESTING
+
+
+def _samples(targets=None):
+    samples = [
+        {
+            DefaultDataKeys.INPUT: torch.randint(255, (3, 4, 4), dtype=torch.uint8),
+            DefaultDataKeys.METADATA: {"size": (4, 4)},
+        }
+        for _ in range(2)
+    ]
+    if targets is not None:
+        for sample, target in zip(samples, targets):
+            sample[DefaultDataKeys.TARGET] = target
+    return samples
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+@pytest.mark.parametrize(
+    "targets, expected",
+    [
+        ([0, 1], torch.tensor([0, 1])),
+        ([[0, 1, 1], [1, 0, 0]], torch.tensor([[0, 1, 1], [1, 0, 0]])),
+        ([torch.tensor([0.0, 1.0]), torch.tensor([1.0, 0.0])], torch.tensor([[0.0, 1.0], [1.0, 0.0]])),
+    ],
+)
+def test_collate(targets, expected):
+    samples = _samples(targets)
+    batch = _collate(samples)
+
+    assert batch[DefaultDataKeys.INPUT].dtype == torch.uint8
+    assert torch.equal(batch[DefaultDataKeys.INPUT], torch.stack([sample[DefaultDataKeys.INPUT] for sample in samples]))
+    assert torch.equal(batch[DefaultDataKeys.TARGET], expected)
+    assert batch[DefaultDataKeys.TARGET].dtype == expected.dtype
+    assert batch[DefaultDataKeys.METADATA]["size"][0].tolist() == [4, 4]
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+def test_collate_no_target():
+    samples = _samples()
+    batch = _collate(samples)
+
+    assert DefaultDataKeys.TARGET not in batch
+    assert batch[DefaultDataKeys.INPUT].shape == (2, 3, 4, 4)
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+def test_collate_in_worker():
+    samples = _samples([0, 1])
+    loader = DataLoader(samples, batch_size=2, num_workers=1, collate_fn=_collate)
+
+    batch = next(iter(loader))
+    assert torch.equal(batch[DefaultDataKeys.INPUT], torch.stack([sample[DefaultDataKeys.INPUT] for sample in samples]))
+    assert torch.equal(batch[DefaultDataKeys.TARGET], torch.tensor([0, 1]))
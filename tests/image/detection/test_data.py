@@ -2,10 +2,19 @@ import json
 import os
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from flash.core.data.data_source import DefaultDataKeys
-from flash.core.utilities.imports import _COCO_AVAILABLE, _FIFTYONE_AVAILABLE, _IMAGE_AVAILABLE, _PIL_AVAILABLE
+from flash.core.utilities.imports import (
+    _COCO_AVAILABLE,
+    _FIFTYONE_AVAILABLE,
+    _IMAGE_AVAILABLE,
+    _NUMBA_AVAILABLE,
+    _ORJSON_AVAILABLE,
+    _PIL_AVAILABLE,
+)
+from flash.image.detection import data as detection_data
 from flash.image.detection.data import ObjectDetectionData
 
 if _PIL_AVAILABLE:
@@ -218,3 +227,168 @@ def test_image_detector_data_from_fiftyone(tmpdir):
     assert imgs[0].shape == (3, 1080, 1920)
     assert len(labels) == 1
     assert list(labels[0].keys()) == ["boxes", "labels", "image_id", "area", "iscrowd"]
+
+
+def _assert_samples_equal(samples, expected_samples):
+    assert len(samples) == len(expected_samples)
+    for sample, expected in zip(samples, expected_samples):
+        if expected is None:
+            assert sample is None
+            continue
+        assert sample["input"] == expected["input"]
+        assert sample["target"]["image_id"] == expected["target"]["image_id"]
+        for key in ("boxes", "labels", "area", "iscrowd"):
+            assert sample["target"][key].dtype == expected["target"][key].dtype
+            np.testing.assert_array_equal(sample["target"][key], expected["target"][key])
+
+
+@pytest.mark.skipif(not _COCO_AVAILABLE, reason="pycocotools is not installed for testing")
+@pytest.mark.skipif(not _ORJSON_AVAILABLE, reason="orjson is not installed for testing")
+@pytest.mark.parametrize("training", [True, False])
+def test_parse_coco_orjson_matches_pycocotools(tmpdir, monkeypatch, training):
+    coco_ann_path = os.fspath(Path(tmpdir / "sample.json"))
+    _create_dummy_coco_json(coco_ann_path)
+
+    # add an image with only small boxes, an image without annotations, and a degenerate box
+    with open(coco_ann_path) as fp:
+        dummy_json = json.load(fp)
+    dummy_json["images"] += [
+        {"id": 2, "width": 1920, "height": 1080, "file_name": "sample_three.png"},
+        {"id": 3, "width": 1920, "height": 1080, "file_name": "sample_four.png"},
+    ]
+    dummy_json["annotations"] += [
+        {"id": 4, "image_id": 2, "category_id": 0, "area": 1, "bbox": [10, 10, 1, 5], "iscrowd": 1},
+        {"id": 5, "image_id": 1, "category_id": 0, "area": 0, "bbox": [5, 5, 0, 10], "iscrowd": 0},
+    ]
+    with open(coco_ann_path, "w") as fp:
+        json.dump(dummy_json, fp)
+
+    def load(orjson_available):
+        monkeypatch.setattr(detection_data, "_ORJSON_AVAILABLE", orjson_available)
+        categories, images, annotations = detection_data._parse_coco(coco_ann_path)
+        return categories, [
+            detection_data._build_coco_sample(image, annotations.get(image["id"], []), "root", training)
+            for image in images
+        ]
+
+    expected_categories, expected_samples = load(False)
+    categories, samples = load(True)
+
+    assert categories == expected_categories
+    _assert_samples_equal(samples, expected_samples)
+
+    assert [sample is None for sample in samples] == [False, False, training, training]
+    np.testing.assert_array_equal(samples[1]["target"]["boxes"], [[50, 100, 330, 115], [230, 130, 320, 310]])
+
+
+@pytest.mark.skipif(not _NUMBA_AVAILABLE, reason="numba is not installed for testing")
+def test_reformat_boxes_numba(monkeypatch):
+    boxes = np.random.default_rng(0).random((detection_data._NUMBA_BOXES_THRESHOLD + 1, 4), dtype=np.float32)
+
+    monkeypatch.setattr(detection_data, "_NUMBA_AVAILABLE", False)
+    expected_boxes, expected_areas = detection_data._reformat_boxes(boxes.copy(), 1920, 1080)
+    output_boxes, output_areas = detection_data._reformat_boxes_numba(boxes.copy(), 1920, 1080)
+
+    assert output_boxes.dtype == expected_boxes.dtype == np.float32
+    assert output_areas.dtype == expected_areas.dtype == np.float32
+    np.testing.assert_allclose(output_boxes, expected_boxes, rtol=1e-6)
+    np.testing.assert_allclose(output_areas, expected_areas, rtol=1e-6)
+
+    # above the threshold, ``_reformat_boxes`` dispatches to the kernel
+    monkeypatch.setattr(detection_data, "_NUMBA_AVAILABLE", True)
+    dispatched_boxes, _ = detection_data._reformat_boxes(boxes.copy(), 1920, 1080)
+    np.testing.assert_array_equal(dispatched_boxes, output_boxes)
+
+
+def _add_fiftyone_samples(dataset, img_dir):
+    """Add a sample with a detection that has no ``iscrowd`` and a sample with no detections."""
+    Image.new("RGB", (1920, 1080)).save(img_dir / "sample_three.png")
+    Image.new("RGB", (1920, 1080)).save(img_dir / "sample_four.png")
+    dataset.add_samples(
+        [
+            fo.Sample(
+                filepath=str(img_dir / "sample_three.png"),
+                ground_truth=fo.Detections(detections=[fo.Detection(label="car", bounding_box=[0.5, 0.5, 0.5, 0.25])]),
+            ),
+            fo.Sample(filepath=str(img_dir / "sample_four.png"), ground_truth=fo.Detections(detections=[])),
+        ]
+    )
+    return dataset
+
+
+@pytest.mark.skipif(not _IMAGE_AVAILABLE, reason="image libraries aren't installed.")
+@pytest.mark.skipif(not _FIFTYONE_AVAILABLE, reason="fiftyone is not installed for testing")
+def test_fiftyone_data_source_targets(tmpdir):
+    dataset = _add_fiftyone_samples(_create_synth_fiftyone_dataset(tmpdir), Path(tmpdir / "fo_imgs"))
+
+    samples = detection_data.ObjectDetectionFiftyOneDataSource().load_data(dataset)
+    targets = {os.path.basename(sample["input"]): sample["target"] for sample in samples}
+
+    assert sorted(target["image_id"] for target in targets.values()) == [1, 2, 3, 4]
+    for target in targets.values():
+        assert target["boxes"].dtype == np.float32
+        assert target["area"].dtype == np.float32
+        assert target["labels"].dtype == np.int64
+        assert target["iscrowd"].dtype == np.uint8
+
+    # classes are sorted: car -> 0, person -> 1
+    target = targets["sample_one.png"]
+    np.testing.assert_allclose(target["boxes"], [[576, 432, 960, 648]], rtol=1e-5)
+    np.testing.assert_allclose(target["area"], [384 * 216], rtol=1e-5)
+    np.testing.assert_array_equal(target["labels"], [1])
+    np.testing.assert_array_equal(target["iscrowd"], [1])
+
+    target = targets["sample_two.png"]
+    np.testing.assert_allclose(target["boxes"], [[96, 108, 633.6, 270], [441.6, 151.2, 614.4, 345.6]], rtol=1e-5)
+    np.testing.assert_allclose(target["area"], [537.6 * 162, 172.8 * 194.4], rtol=1e-5)
+    np.testing.assert_array_equal(target["labels"], [1, 1])
+    np.testing.assert_array_equal(target["iscrowd"], [0, 0])
+
+    target = targets["sample_three.png"]
+    np.testing.assert_allclose(target["boxes"], [[960, 540, 1920, 810]], rtol=1e-5)
+    np.testing.assert_allclose(target["area"], [960 * 270], rtol=1e-5)
+    np.testing.assert_array_equal(target["labels"], [0])
+    np.testing.assert_array_equal(target["iscrowd"], [0])
+
+    target = targets["sample_four.png"]
+    assert target["boxes"].shape == (0, 4)
+    assert target["area"].shape == target["labels"].shape == target["iscrowd"].shape == (0,)
+
+
+@pytest.mark.skipif(not _IMAGE_AVAILABLE, reason="image libraries aren't installed.")
+@pytest.mark.skipif(not _FIFTYONE_AVAILABLE, reason="fiftyone is not installed for testing")
+def test_fiftyone_data_source_parallel_load(tmpdir, monkeypatch):
+    dataset = _add_fiftyone_samples(_create_synth_fiftyone_dataset(tmpdir), Path(tmpdir / "fo_imgs"))
+    data_source = detection_data.ObjectDetectionFiftyOneDataSource()
+
+    expected_samples = data_source.load_data(dataset)
+
+    monkeypatch.setattr(detection_data, "_PARALLEL_LOAD_THRESHOLD", 0)
+    samples = data_source.load_data(dataset)
+
+    _assert_samples_equal(samples, expected_samples)
+
+
+@pytest.mark.skipif(not _IMAGE_AVAILABLE, reason="image libraries aren't installed.")
+@pytest.mark.parametrize(
+    "system, cpu_count, device_count, expected",
+    [
+        ("Linux", 32, 0, 8),
+        ("Linux", 4, 0, 4),
+        ("Linux", None, 0, 1),
+        ("Linux", 32, 2, 8),
+        ("Linux", 12, 4, 3),
+        ("Linux", 2, 4, 1),
+        ("Darwin", 32, 0, 0),
+        ("Windows", 32, 1, 0),
+    ],
+)
+def test_auto_num_workers(monkeypatch, system, cpu_count, device_count, expected):
+    monkeypatch.setattr(detection_data.platform, "system", lambda: system)
+    monkeypatch.setattr(detection_data.os, "cpu_count", lambda: cpu_count)
+    monkeypatch.setattr(detection_data.torch.cuda, "is_available", lambda: device_count > 0)
+    monkeypatch.setattr(detection_data.torch.cuda, "device_count", lambda: device_count)
+
+    assert detection_data._auto_num_workers() == expected
+    assert ObjectDetectionData().num_workers == expected
+    assert ObjectDetectionData(num_workers=2).num_workers == 2
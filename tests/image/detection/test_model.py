@@ -82,6 +82,23 @@ def test_training(tmpdir, model):
     trainer.fit(model, dl)
 
 
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+def test_pretrained_models_are_independent():
+    model_1 = ObjectDetector(num_classes=2)
+    model_2 = ObjectDetector(num_classes=2)
+
+    params_1 = dict(model_1.model.named_parameters())
+    params_2 = dict(model_2.model.named_parameters())
+    for name, param in params_1.items():
+        assert param.data_ptr() != params_2[name].data_ptr()
+
+    name = "backbone.fpn.layer_blocks.0.weight"
+    assert torch.equal(params_1[name], params_2[name])
+    with torch.no_grad():
+        params_1[name].add_(1)
+    assert not torch.equal(params_1[name], params_2[name])
+
+
 @pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
 def test_jit(tmpdir):
     path = os.path.join(tmpdir, "test.pt")
@@ -0,0 +1,90 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+
+from flash.core.utilities.imports import _JPEG4PY_AVAILABLE, _PIL_AVAILABLE, _TURBOJPEG_AVAILABLE
+from flash.image import data as image_data
+from tests.helpers.utils import _IMAGE_TESTING
+
+if _PIL_AVAILABLE:
+    from PIL import Image
+
+if _JPEG4PY_AVAILABLE:
+    import jpeg4py
+
+
+@pytest.fixture
+def jpeg_path(tmpdir):
+    path = str(tmpdir / "image.jpg")
+    Image.fromarray(np.random.randint(0, 255, (48, 64, 3), dtype="uint8")).save(path)
+    return path
+
+
+def _assert_matches_pil(img, filepath):
+    with open(filepath, "rb") as f:
+        expected = Image.open(f).convert("RGB")
+    assert isinstance(img, Image.Image)
+    assert img.mode == expected.mode == "RGB"
+    assert img.size == expected.size == (64, 48)
+    # decoders may differ slightly in IDCT / upsampling, so only compare the pixels approximately
+    assert np.abs(np.asarray(img, dtype=int) - np.asarray(expected, dtype=int)).mean() < 2
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+@pytest.mark.skipif(not _TURBOJPEG_AVAILABLE, reason="PyTurboJPEG isn't installed.")
+def test_load_image_turbojpeg(jpeg_path, monkeypatch):
+    if image_data._turbo_jpeg() is None:
+        pytest.skip("libturbojpeg isn't installed.")
+    monkeypatch.setattr(image_data, "_JPEG4PY_AVAILABLE", False)
+
+    assert image_data._decode_jpeg(jpeg_path) is not None
+    _assert_matches_pil(image_data._load_image(jpeg_path), jpeg_path)
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+@pytest.mark.skipif(not _JPEG4PY_AVAILABLE, reason="jpeg4py isn't installed.")
+def test_load_image_jpeg4py(jpeg_path, monkeypatch):
+    monkeypatch.setattr(image_data, "_TURBOJPEG_AVAILABLE", False)
+
+    assert image_data._decode_jpeg(jpeg_path) is not None
+    _assert_matches_pil(image_data._load_image(jpeg_path), jpeg_path)
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+def test_load_image_turbojpeg_fallback(jpeg_path, monkeypatch):
+    class RejectingTurboJPEG:
+        def decode(self, *args, **kwargs):
+            raise OSError("Unsupported JPEG")
+
+    monkeypatch.setattr(image_data, "_TURBOJPEG_AVAILABLE", True)
+    monkeypatch.setattr(image_data, "_turbo_jpeg", RejectingTurboJPEG)
+    monkeypatch.setattr(image_data, "TJPF_RGB", 0, raising=False)
+    monkeypatch.setattr(image_data, "_JPEG4PY_AVAILABLE", False)
+
+    assert image_data._decode_jpeg(jpeg_path) is None
+    _assert_matches_pil(image_data._load_image(jpeg_path), jpeg_path)
+
+
+@pytest.mark.skipif(not _IMAGE_TESTING, reason="image libraries aren't installed.")
+@pytest.mark.skipif(not _JPEG4PY_AVAILABLE, reason="jpeg4py isn't installed.")
+def test_load_image_jpeg4py_fallback(jpeg_path, monkeypatch):
+    def rejecting_jpeg(_):
+        raise ValueError("Unsupported JPEG")
+
+    monkeypatch.setattr(image_data, "_TURBOJPEG_AVAILABLE", False)
+    monkeypatch.setattr(jpeg4py, "JPEG", rejecting_jpeg)
+
+    assert image_data._decode_jpeg(jpeg_path) is None
+    _assert_matches_pil(image_data._load_image(jpeg_path), jpeg_path)